@@ -50,8 +50,12 @@ Análise de Variabilidade Semântica em Construções Sintáticas (Português)
 import sys
 import os
 import subprocess
+import multiprocessing
 from datetime import datetime
 
+# Evita que cada processo do nlp.pipe abra várias threads BLAS (tem de ser antes de importar o spaCy)
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+
 # ---------------------------
 # Instala dependências se necessário
 # ---------------------------
@@ -63,32 +67,38 @@ def ensure_package(pkg):
         subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
 
 # Pacotes python necessários
-for p in ("pandas", "openpyxl", "beautifulsoup4", "spacy", "nltk"):
+for p in ("pandas", "xlsxwriter", "lxml", "spacy", "nltk", "tqdm"):
     ensure_package(p)
 
-# Instala / garante o modelo spaCy PT
-try:
-    import spacy
-    spacy.load("pt_core_news_lg")
-except Exception:
+# Instala o modelo spaCy PT só se ainda não estiver instalado (sem o carregar)
+import spacy
+if not spacy.util.is_package("pt_core_news_lg"):
     print("Installing spaCy model 'pt_core_news_lg'...")
     subprocess.check_call([sys.executable, "-m", "spacy", "download", "pt_core_news_lg"])
 
 # ---------------------------
 # Imports principais
 # ---------------------------
+import numpy as np
 import pandas as pd
 import re
-import spacy
+import functools
 import nltk
-from bs4 import BeautifulSoup
+from spacy.matcher import DependencyMatcher, Matcher
+from lxml import etree
 from nltk.corpus import wordnet as wn
+from tqdm import tqdm
 
-# Downloads NLTK data se necessário
-nltk.download('wordnet', quiet=True)
-nltk.download('omw-1.4', quiet=True)
-
-nlp = spacy.load("pt_core_news_lg")
+# Downloads NLTK data só se ainda não existirem localmente
+try:
+    nltk.data.find("corpora/omw-1.4")
+except LookupError:
+    nltk.download('omw-1.4', quiet=True)
+try:
+    wn.ensure_loaded()
+except LookupError:
+    nltk.download('wordnet', quiet=True)
+    wn.ensure_loaded()
 
 # ---------------------------
 # CONFIGURAÇÕES DO UTILIZADOR
@@ -101,6 +111,15 @@ FILE_PATH = "/content/drive/MyDrive/Constructions_concordances/EXEMPLO.xml"
 # Escolhe: 'svo', 'n_adj', 'adj_n'
 tipo_construcao = "svo"
 
+# Número de frases processadas de cada vez pelo spaCy (nlp.pipe)
+BATCH_SIZE = 64
+
+# Número de processos usados pelo nlp.pipe (1 = sem paralelização). Os processos são criados
+# com "fork", disponível em Linux/Colab; com "spawn"/"forkserver" cada processo voltaria a
+# executar o script inteiro, por isso noutros sistemas o valor por omissão é 1.
+N_PROCESS = max(1, (os.cpu_count() or 1) - 1) \
+    if sys.platform.startswith("linux") and "fork" in multiprocessing.get_all_start_methods() else 1
+
 # ---------------------------
 # (Opcional) Montar Google Drive em Colab - só faz sentido no Colab
 # ---------------------------
@@ -114,47 +133,94 @@ except Exception:
     # Não estamos no Colab; prosseguir sem montar drive
     pass
 
+# ---------------------------
+# Modelo spaCy
+# ---------------------------
+# O NER não é usado pelos extratores (só POS, dependências e lemas)
+nlp = spacy.load("pt_core_news_lg", disable=["ner"])
+
+# adj_n só precisa de POS: sem o parser (o componente mais pesado) cada Doc sai bem mais barato
+if tipo_construcao == "adj_n":
+    nlp.disable_pipe("parser")
+
 # ---------------------------
 # Funções utilitárias
 # ---------------------------
+_CLEAN_RE = re.compile(r"/[a-zA-Z]+")
+
+# Separador usado para limpar todos os KWICs numa única passagem da regex (caractere de controlo
+# que o XML válido não permite; com recover=True pode surgir via &#x1f;, por isso é retirado antes)
+_KWIC_SEP = "\x1f"
+
 def limpar_kwic(texto_kwic):
     """Remove anotações do KWIC como '/tag'."""
-    return re.sub(r"/[a-zA-Z]+", "", texto_kwic)
-
-def extrair_svo(frase):
-    doc = nlp(frase)
-    sujeito = verbo = objeto = None
-    for token in doc:
-        if token.dep_ == "ROOT" and token.pos_ == "VERB":
-            verbo = token.lemma_
-        elif token.dep_ == "nsubj":
-            sujeito = token.text
-        elif token.dep_ in {"obj", "dobj", "obl", "attr"}:
-            objeto = token.lemma_
-    if verbo and (sujeito or objeto):
-        return {
-            "frase_limpa": frase,
-            "sujeito": sujeito if sujeito else "",
-            "verbo": verbo,
-            "objeto": objeto if objeto else ""
-        }
-    return None
-
-def extrair_n_adj(frase):
-    doc = nlp(frase)
-    for token in doc:
-        if token.pos_ == "ADJ" and token.head.pos_ == "NOUN":
-            return {"frase_limpa": frase, "nome": token.head.lemma_, "adjetivo": token.lemma_}
-    return None
+    return _CLEAN_RE.sub("", texto_kwic)
+
+def limpar_kwics(textos_kwic):
+    """Versão em lote de limpar_kwic: aplica a regex uma só vez ao corpus inteiro."""
+    if not textos_kwic:
+        return []
+    texto = _KWIC_SEP.join(t.replace(_KWIC_SEP, "") for t in textos_kwic)
+    return limpar_kwic(texto).split(_KWIC_SEP)
+
+# Campos devolvidos (por esta ordem) por cada extrator
+CAMPOS_EXTRAIDOS = {
+    "svo": ("sujeito", "verbo", "objeto"),
+    "n_adj": ("nome", "adjetivo"),
+    "adj_n": ("adjetivo", "nome"),
+}
 
-def extrair_adj_n(frase):
-    doc = nlp(frase)
-    for token in doc:
-        if token.pos_ == "ADJ" and token.head.pos_ == "NOUN" and token.i < token.head.i:
-            return {"frase_limpa": frase, "adjetivo": token.lemma_, "nome": token.head.lemma_}
-    for i in range(len(doc) - 1):
-        if doc[i].pos_ == "ADJ" and doc[i + 1].pos_ == "NOUN":
-            return {"frase_limpa": frase, "adjetivo": doc[i].lemma_, "nome": doc[i + 1].lemma_}
+# Relações de dependência aceites como objeto
+_OBJ_DEPS = frozenset({"obj", "dobj", "obl", "attr"})
+
+# Padrões sintáticos, compilados uma vez: a procura nos Docs é feita pelos matchers do spaCy.
+# Sujeito e objeto têm de ser dependentes diretos do verbo ROOT.
+_VERBO = {"RIGHT_ID": "verbo", "RIGHT_ATTRS": {"DEP": "ROOT", "POS": "VERB"}}
+_SUJEITO = {"LEFT_ID": "verbo", "REL_OP": ">", "RIGHT_ID": "sujeito", "RIGHT_ATTRS": {"DEP": "nsubj"}}
+_OBJETO = {"LEFT_ID": "verbo", "REL_OP": ">", "RIGHT_ID": "objeto", "RIGHT_ATTRS": {"DEP": {"IN": sorted(_OBJ_DEPS)}}}
+_PADROES_SVO = {
+    "SVO": [_VERBO, _SUJEITO, _OBJETO],
+    "SV": [_VERBO, _SUJEITO],
+    "VO": [_VERBO, _OBJETO],
+}
+svo_matcher = DependencyMatcher(nlp.vocab)
+for _rotulo, _padrao in _PADROES_SVO.items():
+    svo_matcher.add(_rotulo, [_padrao])
+
+# Adjetivo dependente de um nome (ids devolvidos: nome, adjetivo)
+nome_adj_matcher = DependencyMatcher(nlp.vocab)
+nome_adj_matcher.add("NOME_ADJ", [[
+    {"RIGHT_ID": "nome", "RIGHT_ATTRS": {"POS": "NOUN"}},
+    {"LEFT_ID": "nome", "REL_OP": ">", "RIGHT_ID": "adjetivo", "RIGHT_ATTRS": {"POS": "ADJ"}},
+]])
+
+# Adjetivo imediatamente seguido de um nome (só POS, não precisa do parser)
+adj_n_bigram_matcher = Matcher(nlp.vocab)
+adj_n_bigram_matcher.add("ADJ_N", [[{"POS": "ADJ"}, {"POS": "NOUN"}]])
+
+def extrair_svo(doc):
+    matches = svo_matcher(doc)
+    if not matches:
+        return None
+    # Preferir a correspondência mais completa (SVO antes de SV/VO); em empate fica
+    # o último sujeito e o último objeto da frase
+    match_id, ids = max(matches, key=lambda m: (len(m[1]), m[1]))
+    padrao = _PADROES_SVO[nlp.vocab.strings[match_id]]
+    tokens = {no["RIGHT_ID"]: doc[i] for no, i in zip(padrao, ids)}
+    sujeito = tokens["sujeito"].text if "sujeito" in tokens else ""
+    objeto = tokens["objeto"].lemma_ if "objeto" in tokens else ""
+    return sujeito, tokens["verbo"].lemma_, objeto
+
+def extrair_n_adj(doc):
+    matches = nome_adj_matcher(doc)
+    if not matches:
+        return None
+    _, (i_nome, i_adj) = min(matches, key=lambda m: m[1][1])
+    return doc[i_nome].lemma_, doc[i_adj].lemma_
+
+def extrair_adj_n(doc):
+    for _, inicio, _ in adj_n_bigram_matcher(doc):
+        return doc[inicio].lemma_, doc[inicio + 1].lemma_
     return None
 
 # Mapeamento de subdomínios WordNet -> domínios abrangentes (ajusta conforme necessário)
@@ -184,6 +250,11 @@ def obter_dominios(word, lang='por'):
     """Retorna (dominio, subdominio) para uma palavra; 'desconhecido' se nada for encontrado."""
     if not word or str(word).strip() == "":
         return "desconhecido", "desconhecido"
+    return _dominios_wordnet(str(word).strip().lower(), lang)
+
+@functools.lru_cache(maxsize=None)
+def _dominios_wordnet(word, lang):
+    """Consulta o WordNet uma única vez por (palavra normalizada, língua)."""
     try:
         synsets = wn.synsets(word, lang=lang)
     except Exception:
@@ -195,57 +266,123 @@ def obter_dominios(word, lang='por'):
     dominio_mapeado = mapeamento_dominios.get(subdominio, "outro")
     return dominio_mapeado, subdominio
 
+def normalizar_tokens(serie):
+    """Normaliza tokens para consulta no WordNet (sem espaços, minúsculas; vazios -> NA)."""
+    return serie.astype("string").str.strip().str.lower().replace("", pd.NA)
+
+def mapa_dominios(*series):
+    """Consulta o WordNet uma vez por token distinto e não vazio das séries dadas."""
+    tokens = pd.unique(pd.concat([normalizar_tokens(s) for s in series]).dropna())
+    return {w: obter_dominios(w) for w in tokens}
+
+def atribuir_dominios(df, coluna, col_dominio, col_subdominio, dom_map):
+    """Preenche (dominio, subdominio) a partir de dom_map; tokens vazios ficam 'desconhecido'."""
+    desconhecido = ("desconhecido", "desconhecido")
+    pares = [dom_map.get(w, desconhecido) for w in normalizar_tokens(df[coluna])]
+    df[[col_dominio, col_subdominio]] = pd.DataFrame(pares, index=df.index, columns=[col_dominio, col_subdominio])
+
+def calcular_variabilidade(df, chave, coluna, col_variabilidade, col_dominios):
+    """Para cada valor de `chave`, conta os valores distintos de `coluna` e lista-os ordenados."""
+    if df.empty:
+        return pd.DataFrame(columns=[chave, col_variabilidade, col_dominios])
+    # Códigos inteiros ordenados: um único np.unique sobre os pares (chave, domínio)
+    # devolve-os já sem repetições e ordenados por chave e depois por domínio
+    codigos_chave, chaves = pd.factorize(df[chave], sort=True)
+    codigos_dom, dominios = pd.factorize(df[coluna], sort=True)
+    n_dom = len(dominios)
+    pares = np.unique(codigos_chave * n_dom + codigos_dom)
+    contagens = np.bincount(pares // n_dom, minlength=len(chaves))
+    grupos = np.split(dominios.to_numpy()[pares % n_dom], np.cumsum(contagens)[:-1])
+    return pd.DataFrame({
+        chave: chaves,
+        col_variabilidade: contagens,
+        col_dominios: [", ".join(g) for g in grupos]
+    })
+
+def escrever_folha(writer, df, sheet_name):
+    """Escreve o DataFrame linha a linha (compatível com o modo constant_memory do xlsxwriter)."""
+    # O xlsxwriter ignora em silêncio linhas fora dos limites do Excel; o df.to_excel dava erro
+    max_linhas, max_colunas = 1048576, 16384
+    if len(df) + 1 > max_linhas or len(df.columns) > max_colunas:
+        raise ValueError(
+            f"A folha '{sheet_name}' é demasiado grande: {len(df) + 1} linhas x {len(df.columns)} colunas "
+            f"(máximo {max_linhas} x {max_colunas})."
+        )
+    worksheet = writer.book.add_worksheet(sheet_name)
+    cabecalho = writer.book.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    worksheet.write_row(0, 0, list(df.columns), cabecalho)
+    for i, linha in enumerate(df.itertuples(index=False, name=None), start=1):
+        # Célula a célula: o write_row pára a linha numa string acima de 32767 caracteres, enquanto
+        # o write só a trunca (como o df.to_excel). Valores em falta ficam como célula vazia.
+        for j, valor in enumerate(linha):
+            if not pd.isna(valor):
+                worksheet.write(i, j, valor)
+
 # ---------------------------
 # Leitura do ficheiro XML
 # ---------------------------
 if not os.path.exists(FILE_PATH):
     raise FileNotFoundError(f"Arquivo não encontrado: {FILE_PATH}\nAltera FILE_PATH para o caminho correto.")
 
-with open(FILE_PATH, "r", encoding="utf-8") as f:
-    xml = f.read()
+# Leitura em streaming: cada <kwic> (e o que já foi lido antes dele) é libertado da memória
+# assim que é lido. recover=True tolera exportações com XML mal formado, como o BeautifulSoup.
+frases_originais = []
+for _, elem in etree.iterparse(FILE_PATH, tag="kwic", recover=True):
+    frases_originais.append("".join(elem.itertext()).strip())
+    elem.clear()
+    for no in (elem, *elem.iterancestors()):
+        while no.getprevious() is not None:
+            del no.getparent()[0]
 
-soup = BeautifulSoup(xml, "xml")
-kwics = soup.find_all("kwic")
-kwic_pairs = [(limpar_kwic(k.text.strip()), k.text.strip()) for k in kwics]
-
-frases_limpas = [p[0] for p in kwic_pairs]
-frases_originais = [p[1] for p in kwic_pairs]
+frases_limpas = limpar_kwics(frases_originais)
+kwic_pairs = list(zip(frases_limpas, frases_originais))
 
 # ---------------------------
 # Extrair e construir dataset
 # ---------------------------
-dados = []
-for frase_limpa, frase_original in kwic_pairs:
+# As frases são analisadas em lote com nlp.pipe; os extratores recebem o Doc já processado.
+# Com as_tuples=True a frase original acompanha cada Doc (também entre processos).
+# Os resultados são acumulados por coluna (dict de listas) para construir o DataFrame diretamente.
+campos = CAMPOS_EXTRAIDOS.get(tipo_construcao, ())
+dados = {c: [] for c in ("frase_limpa", *campos, "frase_original")}
+if N_PROCESS > 1:
+    # O nlp.pipe cria os processos com o método por omissão, que no Python >= 3.14 já não é "fork"
+    multiprocessing.set_start_method("fork", force=True)
+docs = nlp.pipe(kwic_pairs, as_tuples=True, batch_size=BATCH_SIZE, n_process=N_PROCESS)
+for doc, frase_original in tqdm(docs, total=len(kwic_pairs), desc="Extração"):
     if tipo_construcao == "svo":
-        extraido = extrair_svo(frase_limpa)
+        extraido = extrair_svo(doc)
     elif tipo_construcao == "n_adj":
-        extraido = extrair_n_adj(frase_limpa)
+        extraido = extrair_n_adj(doc)
     elif tipo_construcao == "adj_n":
-        extraido = extrair_adj_n(frase_limpa)
+        extraido = extrair_adj_n(doc)
     else:
         extraido = None
     if extraido:
-        extraido["frase_original"] = frase_original
-        extraido["frase_limpa"] = frase_limpa
-        dados.append(extraido)
+        dados["frase_limpa"].append(doc.text)
+        for campo, valor in zip(campos, extraido):
+            dados[campo].append(valor)
+        dados["frase_original"].append(frase_original)
 
-print(f"Número de frases extraídas: {len(dados)}")
+print(f"Número de frases extraídas: {len(dados['frase_limpa'])}")
 
-# Preenche domínios
+# dtype=str mantém as colunas de texto mesmo quando nenhuma frase é extraída
+df = pd.DataFrame(dados, dtype=str)
 
-for entrada in dados:
-    if tipo_construcao == "svo":
-        entrada["dominio"], entrada["subdominio"] = obter_dominios(entrada.get("objeto", ""))
-        entrada["dominio_sujeito"], entrada["subdominio_sujeito"] = obter_dominios(entrada.get("sujeito", ""))
-        entrada["construcao"] = f"{entrada['verbo']} X"
-    elif tipo_construcao == "n_adj":
-        entrada["dominio"], entrada["subdominio"] = obter_dominios(entrada.get("nome", ""))
-        entrada["construcao"] = f"{entrada['nome']} + {entrada['adjetivo']}"
-    elif tipo_construcao == "adj_n":
-        entrada["dominio"], entrada["subdominio"] = obter_dominios(entrada.get("nome", ""))
-        entrada["construcao"] = f"{entrada['adjetivo']} {entrada['nome']}"
-
-df = pd.DataFrame(dados)
+# Preenche domínios: o WordNet é consultado uma vez por palavra distinta e não vazia,
+# e o resultado é propagado a todas as linhas
+if tipo_construcao == "svo":
+    dom_map = mapa_dominios(df["objeto"], df["sujeito"])
+    atribuir_dominios(df, "objeto", "dominio", "subdominio", dom_map)
+    atribuir_dominios(df, "sujeito", "dominio_sujeito", "subdominio_sujeito", dom_map)
+    df["construcao"] = df["verbo"] + " X"
+elif tipo_construcao in ["n_adj", "adj_n"]:
+    dom_map = mapa_dominios(df["nome"])
+    atribuir_dominios(df, "nome", "dominio", "subdominio", dom_map)
+    if tipo_construcao == "n_adj":
+        df["construcao"] = df["nome"] + " + " + df["adjetivo"]
+    else:
+        df["construcao"] = df["adjetivo"] + " " + df["nome"]
 
 # Normalização de tokens para comparações
 if tipo_construcao in ["n_adj", "adj_n"]:
@@ -253,46 +390,26 @@ if tipo_construcao in ["n_adj", "adj_n"]:
     df["adjetivo"] = df["adjetivo"].astype(str).str.lower()
 
 if tipo_construcao == "svo":
-    # remover Verbos Leves
-    verbos_leves = {"fazer", "ter", "dar", "estar", "haver", "ficar", "pôr", "levar", "deixar", "manter"}
-    df = df[~df["verbo"].isin(verbos_leves)].copy()
+    # remover Verbos Leves (lemas normalizados uma única vez; isin faz a procura por hash)
+    verbos_leves = frozenset({"fazer", "ter", "dar", "estar", "haver", "ficar", "pôr", "levar", "deixar", "manter"})
+    mask = df["verbo"].str.lower().isin(verbos_leves)
+    df = df.loc[~mask].copy()
 
 # ---------------------------
 # Cálculo da variabilidade
 # ---------------------------
 if tipo_construcao == "svo":
-    agrupados_verbo_obj = df.groupby("verbo")["dominio"].apply(list)
-    df_var_verbo_obj = agrupados_verbo_obj.apply(lambda x: pd.Series({
-        "variabilidade_verbo_obj": len(set(x)),
-        "dominios_obj": ", ".join(sorted(set(x)))
-    })).reset_index()
-
-    agrupados_verbo_suj = df.groupby("verbo")["dominio_sujeito"].apply(list)
-    df_var_verbo_suj = agrupados_verbo_suj.apply(lambda x: pd.Series({
-        "variabilidade_verbo_suj": len(set(x)),
-        "dominios_suj": ", ".join(sorted(set(x)))
-    })).reset_index()
+    df_var_verbo_obj = calcular_variabilidade(df, "verbo", "dominio", "variabilidade_verbo_obj", "dominios_obj")
+    df_var_verbo_suj = calcular_variabilidade(df, "verbo", "dominio_sujeito", "variabilidade_verbo_suj", "dominios_suj")
 
 elif tipo_construcao == "adj_n":
-    agrupados = df.groupby("adjetivo")["dominio"].apply(list)
-    df_var = agrupados.apply(lambda x: pd.Series({
-        "variabilidade_semântica": len(set(x)),
-        "dominios": ", ".join(sorted(set(x)))
-    })).reset_index()
+    df_var = calcular_variabilidade(df, "adjetivo", "dominio", "variabilidade_semântica", "dominios")
     df_var = df_var.rename(columns={"adjetivo": "construcao"})
 
 elif tipo_construcao == "n_adj":
-    df['dominio_adjetivo'], df['subdominio_adjetivo'] = zip(*df['adjetivo'].apply(obter_dominios))
-    agrupados_nome = df.groupby("nome")["dominio_adjetivo"].apply(list)
-    df_var_nome = agrupados_nome.apply(lambda x: pd.Series({
-        "variabilidade_nome": len(set(x)),
-        "dominios": ", ".join(sorted(set(x)))
-    })).reset_index()
-    agrupados_adj = df.groupby("adjetivo")["dominio"].apply(list)
-    df_var_adj = agrupados_adj.apply(lambda x: pd.Series({
-        "variabilidade_adjetivo": len(set(x)),
-        "dominios": ", ".join(sorted(set(x)))
-    })).reset_index()
+    atribuir_dominios(df, "adjetivo", "dominio_adjetivo", "subdominio_adjetivo", mapa_dominios(df["adjetivo"]))
+    df_var_nome = calcular_variabilidade(df, "nome", "dominio_adjetivo", "variabilidade_nome", "dominios")
+    df_var_adj = calcular_variabilidade(df, "adjetivo", "dominio", "variabilidade_adjetivo", "dominios")
 
 # ---------------------------
 # Mostrar resultados no terminal (resumo)
@@ -370,16 +487,21 @@ timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 output_path = f"/content/drive/MyDrive/Constructions_concordances/output_variabilidade_{tipo_construcao}_{timestamp}.xlsx" \
     if FILE_PATH.startswith("/content/drive") else f"output_variabilidade_{tipo_construcao}_{timestamp}.xlsx"
 
-with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-    df.to_excel(writer, index=False, sheet_name="Construcoes")
+# xlsxwriter é bastante mais rápido que o openpyxl; strings_to_urls=False evita analisar cada frase como URL.
+# Com constant_memory cada linha é gravada em disco assim que a seguinte começa, por isso as folhas
+# são escritas linha a linha e por ordem (o df.to_excel escreve por colunas e perderia dados).
+# nan_inf_to_errors só afeta valores infinitos (os NaN são escritos como células vazias).
+excel_options = {'constant_memory': True, 'strings_to_urls': False, 'nan_inf_to_errors': True}
+with pd.ExcelWriter(output_path, engine='xlsxwriter', engine_kwargs={'options': excel_options}) as writer:
+    escrever_folha(writer, df, "Construcoes")
 
     if tipo_construcao == "svo":
-        df_var_obj_sorted.to_excel(writer, index=False, sheet_name="Variabilidade_verbo_objeto")
-        df_var_suj_sorted.to_excel(writer, index=False, sheet_name="Variabilidade_verbo_sujeito")
+        escrever_folha(writer, df_var_obj_sorted, "Variabilidade_verbo_objeto")
+        escrever_folha(writer, df_var_suj_sorted, "Variabilidade_verbo_sujeito")
     elif tipo_construcao == "n_adj":
-        df_var_nome_sorted.to_excel(writer, index=False, sheet_name="Variabilidade_nome")
-        df_var_adj_sorted.to_excel(writer, index=False, sheet_name="Variabilidade_adjetivo")
+        escrever_folha(writer, df_var_nome_sorted, "Variabilidade_nome")
+        escrever_folha(writer, df_var_adj_sorted, "Variabilidade_adjetivo")
     elif tipo_construcao == "adj_n":
-        df_var_sorted.to_excel(writer, index=False, sheet_name="Variabilidade")
+        escrever_folha(writer, df_var_sorted, "Variabilidade")
 
 print(f"\n📁 Ficheiro exportado com sucesso: {output_path}")